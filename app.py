@@ -2,52 +2,62 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, NoSuchWindowException
-import time
-import pandas as pd
-import smtplib
-from email.message import EmailMessage
+from selenium.common.exceptions import TimeoutException
 import os
 import json
 import re
+import threading
+from collections import Counter, defaultdict
 from datetime import datetime
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
-from openpyxl import load_workbook
-from openpyxl.styles import Font, PatternFill
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, NamedStyle, PatternFill
+from openpyxl.utils import get_column_letter
+
+# orjson is optional; it (de)serializes the history/cache files several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 print("Starting COMBINED ECIL + EGPS (ISRO) tender extraction...")
 
 # ==============================
 # BROWSER WINDOW HELPERS
 # ==============================
-def safe_maximize_window(driver):
+def wait_for(driver, locator, timeout=10):
+    return WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
+
+def wait_for_page_ready(driver, timeout=10):
+    # Drivers use the 'eager' load strategy, so DOMContentLoaded is enough
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
+    )
+    wait_for(driver, (By.TAG_NAME, "body"), timeout)
+
+def wait_for_documents(driver, selector, timeout):
+    # Detail pages fill their document tables after DOMContentLoaded, which is when
+    # an 'eager' driver.get() returns; wait for the first document link, but only
+    # briefly, since a page may genuinely have no documents
     try:
-        driver.maximize_window()
-    except Exception as e:
-        print(f"! Maximize window skipped: {e}")
-        try:
-            driver.set_window_size(1400, 900)
-        except Exception as size_error:
-            print(f"! Window resize skipped: {size_error}")
+        wait_for(driver, (By.CSS_SELECTOR, selector), timeout)
+        return True
+    except TimeoutException:
+        print("    ⚠️ No document links appeared")
+        return False
 
-def safe_close_extra_windows(driver, main_window):
+def wait_for_page_change(driver, old_element, locator, timeout=10):
     try:
-        all_windows = driver.window_handles
-        for window in all_windows:
-            if window != main_window:
-                try:
-                    driver.switch_to.window(window)
-                    driver.close()
-                except:
-                    pass
-        driver.switch_to.window(main_window)
-    except Exception as e:
-        print(f"    ⚠️ Window cleanup error: {e}")
-        try:
-            driver.switch_to.window(main_window)
-        except:
-            pass
+        if old_element is not None:
+            WebDriverWait(driver, timeout).until(EC.staleness_of(old_element))
+        wait_for(driver, locator, timeout)
+    except TimeoutException:
+        print("  ⚠️ Page change timeout")
 
 def get_available_filename(base_name):
     if not os.path.exists(base_name):
@@ -84,6 +94,110 @@ if not receiver_emails:
 
 base_file_name = "combined_tenders.xlsx"
 HISTORY_FILE = "combined_tender_history.json"
+DOC_CACHE_FILE = "combined_doc_cache.json"
+DOC_CACHE_CHECKPOINT = 10
+HTTP_CACHE_DIR = ".tender_http_cache"
+
+ECIL_HOME_URL = "https://etenders.ecil.co.in/"
+EGPS_HOME_URL = "https://eproc.isro.gov.in/home.html"
+DETAIL_WORKERS = 4
+DOC_WAIT_TIMEOUT = 5
+
+ECIL_ROWS_LOCATOR = (By.XPATH, "//table//tbody//tr[td] | //table[contains(@class, 'table')]//tr[td]")
+EGPS_ROWS_LOCATOR = (By.CSS_SELECTOR, "table tbody tr td")
+
+# Text the way Selenium's .text reads it: "" for elements that aren't rendered
+# (display:none rows, templates, <script>) and &nbsp; as a plain space.
+# innerText alone does neither, so every in-page snapshot goes through this
+VISIBLE_TEXT_JS = """
+const isRendered = el => el instanceof HTMLElement && el.getClientRects().length > 0;
+const visibleText = el => isRendered(el) ? el.innerText.replace(/\\u00a0/g, ' ').trim() : '';
+"""
+
+# Listing pages are read with a single execute_script per page: the visible
+# rows' cell texts plus the links the scrapers need, instead of a WebDriver
+# round-trip per cell and per link
+ECIL_LISTING_JS = VISIBLE_TEXT_JS + """
+const rows = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const out = [];
+for (let i = 0; i < rows.snapshotLength; i++) {
+    const row = rows.snapshotItem(i);
+    if (!isRendered(row)) continue;
+    const tds = row.querySelectorAll('td');
+    const a = tds[1] ? tds[1].querySelector('a') : null;
+    out.push({
+        cells: Array.from(tds).map(visibleText),
+        link: a && a.getAttribute('href') !== null ? a.href : ''
+    });
+}
+return out;
+"""
+
+EGPS_LISTING_JS = VISIBLE_TEXT_JS + """
+return Array.from(document.querySelectorAll('table tbody tr')).filter(isRendered).map(tr => {
+    const tds = tr.querySelectorAll('td');
+    return {
+        cells: Array.from(tds).map(visibleText),
+        actions: Array.from(tds[5] ? tds[5].querySelectorAll('a') : []).map(a => ({
+            text: visibleText(a),
+            href: a.getAttribute('href') !== null ? a.href : '',
+            data_url: a.getAttribute('data-url') || ''
+        }))
+    };
+});
+"""
+
+# Texts of the purely numeric links matching a selector (pagination candidates)
+PAGE_LINK_TEXTS_JS = VISIBLE_TEXT_JS + """
+return Array.from(document.querySelectorAll(arguments[0]))
+    .map(visibleText)
+    .filter(t => /^\\d+$/.test(t));
+"""
+
+# Texts of pager-like elements that mention "of N" ("Page 1 of 5"), in document order.
+# The XPath also matches <script> and SVG nodes; visibleText reads those as ""
+PAGE_OF_TEXTS_JS = VISIBLE_TEXT_JS + """
+const nodes = document.evaluate("//*[contains(text(), 'of') or contains(@class, 'page')]", document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const out = [];
+for (let i = 0; i < nodes.snapshotLength; i++) {
+    const text = visibleText(nodes.snapshotItem(i));
+    if (/of\\s+\\d+/i.test(text)) out.push(text);
+}
+return out;
+"""
+
+ONCLICK_URL_RE = re.compile(r"'([^']*(?:viewDocument|downloadDocument)[^']*)'")
+PAGE_OF_RE = re.compile(r'of\s+(\d+)', re.IGNORECASE)
+# Pattern: "Published Date : 16-02-2026 17:20 IST"
+PUBLISHED_DATE_RE = re.compile(
+    r'Published Date\s*[:\-]?\s*(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4}(?:\s+\d{1,2}:\d{2}(?::\d{2})?(?:\s*[APap][Mm])?(?:\s*IST)?)?)',
+    re.IGNORECASE
+)
+DATE_ANY_RE = re.compile(r'\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4}')
+
+# Excel styles are built once and shared by every cell that uses them
+GREEN_FILL  = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+YELLOW_FILL = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
+GRAY_FILL   = PatternFill(start_color="D9D9D9", end_color="D9D9D9", fill_type="solid")
+HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+LINK_FONT   = Font(color="0563C1", underline="single")
+
+# Named styles are stored once in styles.xml and referenced by name from each
+# cell, instead of every cell carrying its own fill/font combination
+HEADER_STYLE       = NamedStyle(name="header", fill=HEADER_FILL, font=HEADER_FONT)
+ROW_NEW_STYLE      = NamedStyle(name="row_new", fill=GREEN_FILL)
+ROW_CHANGED_STYLE  = NamedStyle(name="row_changed", fill=YELLOW_FILL)
+ROW_EXISTING_STYLE = NamedStyle(name="row_existing", fill=GRAY_FILL)
+EXCEL_STYLES = [HEADER_STYLE, ROW_NEW_STYLE, ROW_CHANGED_STYLE, ROW_EXISTING_STYLE]
+STATUS_STYLES = {"NEW": ROW_NEW_STYLE.name, "DATE CHANGED": ROW_CHANGED_STYLE.name}
+
+# Characters Excel rejects in sheet names: path separators become '-', the rest are dropped
+SHEET_NAME_TABLE = str.maketrans({'/': '-', '\\': '-', '*': None, '[': None, ']': None})
+
+@lru_cache(maxsize=512)
+def sanitize_sheet_name(name):
+    return name[:31].translate(SHEET_NAME_TABLE)
 
 # ==============================
 # TENDER HISTORY MANAGEMENT
@@ -91,17 +205,35 @@ HISTORY_FILE = "combined_tender_history.json"
 def load_tender_history():
     if Path(HISTORY_FILE).exists():
         try:
-            with open(HISTORY_FILE, "r") as f:
-                return json.load(f)
+            with open(HISTORY_FILE, "rb") as f:
+                return json_loads(f.read())
         except Exception as e:
             print(f"⚠️ Error loading history: {e}")
             return {"ECIL": {}, "EGPS": {}}
     return {"ECIL": {}, "EGPS": {}}
 
+def json_dumps(data, indent=None):
+    # orjson only supports 2-space indentation, which is what the files use
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=indent).encode()
+    return json.dumps(data, separators=(",", ":")).encode()
+
+def json_loads(raw):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def write_json_atomic(path, data, indent=None):
+    # Write to a temp file and swap it in, so a crash mid-write never leaves a truncated file.
+    # Without indent the output is compact, which is much cheaper for frequent checkpoints
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(json_dumps(data, indent))
+    os.replace(tmp_path, path)
+
 def save_tender_history(history):
     try:
-        with open(HISTORY_FILE, "w") as f:
-            json.dump(history, f, indent=2)
+        write_json_atomic(HISTORY_FILE, history, indent=2)
     except Exception as e:
         print(f"⚠️ Error saving history: {e}")
 
@@ -123,61 +255,180 @@ def check_date_changes(current_data, history, source):
                 })
     return changes
 
-def update_tender_history(ecil_data, egps_data):
-    history = load_tender_history()
-    # ecil entry: [tender_no, centre, description, closing_date, published_date, opening_date, link, doc_links]
+def get_cached_details(known_tenders, tender_no, closing_date, corrigendum_link=""):
+    """
+    Return the history record for a tender whose closing date is unchanged and
+    whose detail pages were all read successfully last time, so they can be skipped.
+    A corrigendum link that wasn't there last time also forces a re-read.
+    """
+    cached = known_tenders.get(tender_no)
+    if (cached and cached.get("details_fetched")
+            and cached.get("closing_date") == closing_date
+            and cached.get("corrigendum_link", "") == corrigendum_link):
+        return cached
+    return None
+
+def update_tender_history(history, ecil_data, egps_data):
+    # Updates the history already loaded at startup in place, rather than
+    # re-reading and re-parsing the file just to rewrite it
+
+    # One timestamp for the whole batch
+    last_seen = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # ecil entry: [tender_no, centre, description, closing_date, published_date, opening_date, link, doc_links, details]
     for entry in ecil_data:
         tender_no = entry[0]
         history["ECIL"][tender_no] = {
             "description": entry[2],
             "closing_date": entry[3],
-            "last_seen": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "published_date": entry[4],
+            "doc_links": entry[7],
+            "last_seen": last_seen,
+            **entry[8]
         }
-    # egps entry: [tender_no, centre, description, closing_date, published_date, opening_date, link, doc_links]
+    # egps entry: [tender_no, centre, description, closing_date, published_date, opening_date, link, doc_links, details]
     for entry in egps_data:
         tender_no = entry[0]
         history["EGPS"][tender_no] = {
             "centre": entry[1],
             "description": entry[2],
             "closing_date": entry[3],
-            "last_seen": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "published_date": entry[4],
+            "doc_links": entry[7],
+            "last_seen": last_seen,
+            **entry[8]
         }
     save_tender_history(history)
     print(f"✅ History updated: ECIL={len(ecil_data)}, EGPS={len(egps_data)}")
 
+# ==============================
+# DETAIL PAGE DOCUMENT CACHE
+# ==============================
+# url -> {"doc_links", "published_date", "week"}; shared by the detail workers
+doc_cache = {}
+doc_cache_lock = threading.Lock()
+doc_cache_unsaved = 0
+
+def current_cache_week():
+    year, week, _ = datetime.now().isocalendar()
+    return f"{year}-W{week:02d}"
+
+def load_doc_cache():
+    # Only entries from the current week are reused, so pages are re-read at least weekly
+    if Path(DOC_CACHE_FILE).exists():
+        try:
+            with open(DOC_CACHE_FILE, "rb") as f:
+                cache = json_loads(f.read())
+            week = current_cache_week()
+            return {url: entry for url, entry in cache.items() if entry.get("week") == week}
+        except Exception as e:
+            print(f"⚠️ Error loading document cache: {e}")
+    return {}
+
+def save_doc_cache(indent=2):
+    global doc_cache_unsaved
+    try:
+        write_json_atomic(DOC_CACHE_FILE, doc_cache, indent=indent)
+        doc_cache_unsaved = 0
+    except Exception as e:
+        print(f"⚠️ Error saving document cache: {e}")
+
+# ==============================
+# DOCUMENT LINK EXTRACTION (shared by ECIL and EGPS)
+# ==============================
+# One round-trip returns every anchor matching the selector, instead of a
+# get_attribute/.text WebDriver call per link. The first three cells of the
+# link's table row are included for naming links labelled only "View"/"Download"
+DOC_LINKS_JS = VISIBLE_TEXT_JS + """
+return Array.from(document.querySelectorAll(arguments[0])).map(a => {
+    const row = a.closest('tr');
+    return {
+        href: a.getAttribute('href') !== null ? a.href : null,
+        data_url: a.getAttribute('data-url'),
+        onclick: a.getAttribute('onclick'),
+        text: visibleText(a),
+        row_cells: row ? Array.from(row.querySelectorAll('td')).slice(0, 3).map(visibleText) : []
+    };
+});
+"""
+
+ECIL_DOC_SELECTOR = "a[href*='.pdf'], a[href*='.PDF']"
+EGPS_DOC_SELECTOR = (
+    "a[href*='.pdf'], a[href*='.PDF'], a[href*='viewDocument'], a[href*='downloadDocument'], "
+    "a[onclick*='viewDocument'], a[data-url*='viewDocument']"
+)
+PLACEHOLDER_LINK_TEXTS = ["--NA--", "View", "Download", "Open", "Click Here"]
+
+def extract_documents(driver, selector, name_from_row=False, prefix=None, skip_na=False):
+    """
+    Collect (name, url) document links from the current page.
+    Links without an href are resolved from data-url / onclick (EGPS viewDocument).
+    Placeholder labels are replaced by the first meaningful cell of the link's row
+    (if name_from_row) or else the file name; prefix ("View"/"Corrigendum") is
+    prepended to names that don't already start with it. With skip_na (ECIL),
+    links whose name still contains "--NA--" are dropped.
+    """
+    doc_links = []
+    seen_urls = set()
+
+    all_links = driver.execute_script(DOC_LINKS_JS, selector)
+    print(f"    Found {len(all_links)} potential links")
+
+    for link in all_links:
+        data_url = link["data_url"]
+        onclick = link["onclick"]
+        name = link["text"]
+
+        url = link["href"]
+        if data_url and not url:
+            url = "https://eproc.isro.gov.in" + data_url
+        elif onclick and not url:
+            match = ONCLICK_URL_RE.search(onclick)
+            if match:
+                url = "https://eproc.isro.gov.in" + match.group(1)
+
+        if not url or not (
+            '.pdf' in url.lower() or
+            'viewDocument' in url or
+            'downloadDocument' in url
+        ):
+            continue
+
+        if not name or name in PLACEHOLDER_LINK_TEXTS:
+            if name_from_row:
+                for cell_text in link["row_cells"]:
+                    if cell_text and cell_text not in PLACEHOLDER_LINK_TEXTS:
+                        name = cell_text
+                        break
+            if not name or name in PLACEHOLDER_LINK_TEXTS:
+                name = url.split('/')[-1].replace('.pdf', '').replace('.PDF', '') or "Document"
+
+        if skip_na and "--NA--" in name:
+            continue
+
+        if prefix and not name.startswith(prefix):
+            name = f"{prefix} - {name}"
+
+        if url not in seen_urls:
+            seen_urls.add(url)
+            doc_links.append((name, url))
+            print(f"    ✓ {name[:60]}")
+
+    print(f"    📎 Total docs: {len(doc_links)}")
+    return doc_links
+
 # ==============================
 # ECIL DOCUMENT EXTRACTION
 # ==============================
 def extract_ecil_documents(driver):
-    doc_links = []
     try:
-        time.sleep(2)
         try:
-            WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            wait_for_page_ready(driver)
         except TimeoutException:
             print("    ⚠️ Page load timeout")
             return []
 
-        pdf_elements = driver.find_elements(By.XPATH,
-            "//a[contains(@href, '.pdf') or contains(@href, '.PDF')]"
-        )
-        print(f"    Found {len(pdf_elements)} PDF links")
-
-        for pdf in pdf_elements:
-            try:
-                url = pdf.get_attribute("href")
-                name = pdf.text.strip()
-                if not name or name in ["--NA--", "Download", "View"]:
-                    name = url.split("/")[-1].replace('.pdf', '').replace('.PDF', '')
-                if url and "--NA--" not in name and url not in [x[1] for x in doc_links]:
-                    doc_links.append((name, url))
-                    print(f"    ✓ {name[:60]}")
-            except Exception as e:
-                print(f"    ⚠️ Error extracting PDF link: {e}")
-                continue
-
-        print(f"    📎 Total: {len(doc_links)}")
-        return doc_links
+        wait_for_documents(driver, ECIL_DOC_SELECTOR, DOC_WAIT_TIMEOUT)
+        return extract_documents(driver, ECIL_DOC_SELECTOR, skip_na=True)
     except Exception as e:
         print(f"    ✗ Error: {e}")
         return []
@@ -185,6 +436,23 @@ def extract_ecil_documents(driver):
 # ==============================
 # EGPS (ISRO) DOCUMENT EXTRACTION + PUBLISHED DATE
 # ==============================
+# Text around each element whose own text mentions "Published Date" (its parent
+# and next sibling), plus the page text as a fallback
+PUBLISHED_DATE_JS = VISIBLE_TEXT_JS + """
+const nodes = document.evaluate("//*[contains(text(), 'Published Date')]", document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const labels = [];
+for (let i = 0; i < nodes.snapshotLength; i++) {
+    const el = nodes.snapshotItem(i);
+    if (!isRendered(el)) continue;
+    const sibling = el.nextElementSibling;
+    labels.push({
+        parent: el.parentElement ? visibleText(el.parentElement) : '',
+        sibling: sibling ? visibleText(sibling) : ''
+    });
+}
+return {labels: labels, body: document.body ? visibleText(document.body) : ''};
+"""
+
 def extract_egps_documents_and_published_date(driver, page_type="View"):
     """
     Extract document links AND published date from EGPS View page.
@@ -195,58 +463,40 @@ def extract_egps_documents_and_published_date(driver, page_type="View"):
       - Bid Opening Date
     Returns: (doc_links, published_date)
     """
-    doc_links = []
     published_date = ""
 
     try:
-        time.sleep(2)
         try:
-            WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            wait_for_page_ready(driver)
         except TimeoutException:
             print("    ⚠️ Page load timeout")
             return [], ""
 
+        # The schedule and document tables are rendered together
+        wait_for_documents(driver, EGPS_DOC_SELECTOR, DOC_WAIT_TIMEOUT)
+
         # ── Extract Published Date from Tender Schedule ──
         try:
-            # Look for the label "Published Date" and grab the adjacent value
-            pub_date_elements = driver.find_elements(By.XPATH,
-                "//*[contains(text(), 'Published Date')]"
-            )
-            for elem in pub_date_elements:
-                try:
-                    # Try sibling or parent-sibling approach
-                    parent = elem.find_element(By.XPATH, "..")
-                    parent_text = parent.text.strip()
-                    # Pattern: "Published Date : 16-02-2026 17:20 IST"
-                    match = re.search(
-                        r'Published Date\s*[:\-]?\s*(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4}(?:\s+\d{1,2}:\d{2}(?::\d{2})?(?:\s*[APap][Mm])?(?:\s*IST)?)?)',
-                        parent_text, re.IGNORECASE
-                    )
-                    if match:
-                        published_date = match.group(1).strip()
-                        print(f"    📅 Published Date: {published_date}")
-                        break
+            # One round-trip for every "Published Date" label's surroundings plus
+            # the body text, instead of find_element/.text calls per label
+            snapshot = driver.execute_script(PUBLISHED_DATE_JS)
+            for label in snapshot["labels"]:
+                match = PUBLISHED_DATE_RE.search(label["parent"])
+                if match:
+                    published_date = match.group(1).strip()
+                    print(f"    📅 Published Date: {published_date}")
+                    break
 
-                    # Try next sibling td or div
-                    try:
-                        sibling = elem.find_element(By.XPATH, "following-sibling::*[1]")
-                        sib_text = sibling.text.strip()
-                        if sib_text and re.search(r'\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4}', sib_text):
-                            published_date = sib_text
-                            print(f"    📅 Published Date (sibling): {published_date}")
-                            break
-                    except:
-                        pass
-                except:
-                    continue
+                # Try next sibling td or div
+                sib_text = label["sibling"]
+                if sib_text and DATE_ANY_RE.search(sib_text):
+                    published_date = sib_text
+                    print(f"    📅 Published Date (sibling): {published_date}")
+                    break
 
             # Fallback: search full page text
             if not published_date:
-                body_text = driver.find_element(By.TAG_NAME, "body").text
-                match = re.search(
-                    r'Published Date\s*[:\-]?\s*(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4}(?:\s+\d{1,2}:\d{2}(?::\d{2})?(?:\s*[APap][Mm])?(?:\s*IST)?)?)',
-                    body_text, re.IGNORECASE
-                )
+                match = PUBLISHED_DATE_RE.search(snapshot["body"])
                 if match:
                     published_date = match.group(1).strip()
                     print(f"    📅 Published Date (body): {published_date}")
@@ -255,60 +505,7 @@ def extract_egps_documents_and_published_date(driver, page_type="View"):
             print(f"    ⚠️ Published date extraction error: {e}")
 
         # ── Extract Document Links ──
-        all_links = driver.find_elements(By.XPATH,
-            "//a[contains(@href, '.pdf') or contains(@href, '.PDF') or "
-            "contains(@href, 'viewDocument') or contains(@href, 'downloadDocument') or "
-            "contains(@onclick, 'viewDocument') or contains(@data-url, 'viewDocument')]"
-        )
-        print(f"    Found {len(all_links)} potential links")
-
-        for link in all_links:
-            try:
-                href = link.get_attribute("href")
-                data_url = link.get_attribute("data-url")
-                onclick = link.get_attribute("onclick")
-                text = link.text.strip()
-
-                url = href
-                if data_url and not url:
-                    url = "https://eproc.isro.gov.in" + data_url
-                elif onclick and not url:
-                    match = re.search(r"'([^']*(?:viewDocument|downloadDocument)[^']*)'", onclick)
-                    if match:
-                        url = "https://eproc.isro.gov.in" + match.group(1)
-
-                if url and (
-                    '.pdf' in url.lower() or
-                    'viewDocument' in url or
-                    'downloadDocument' in url
-                ):
-                    if not text or text in ["View", "Download", "Open", "Click Here"]:
-                        try:
-                            parent_row = link.find_element(By.XPATH, "./ancestor::tr[1]")
-                            cells = parent_row.find_elements(By.TAG_NAME, "td")
-                            for cell in cells[:3]:
-                                cell_text = cell.text.strip()
-                                if cell_text and cell_text not in ["View", "Download", "Open", ""]:
-                                    text = cell_text
-                                    break
-                        except:
-                            pass
-                        if not text or text in ["View", "Download", "Open"]:
-                            text = url.split('/')[-1].replace('.pdf', '').replace('.PDF', '') or "Document"
-
-                    if page_type == "Corrigendum" and not text.startswith("Corrigendum"):
-                        text = f"Corrigendum - {text}"
-                    elif page_type == "View" and not text.startswith("View"):
-                        text = f"View - {text}"
-
-                    if url not in [x[1] for x in doc_links]:
-                        doc_links.append((text, url))
-                        print(f"    ✓ {text[:60]}")
-            except Exception as e:
-                print(f"    ⚠️ Error extracting link: {e}")
-                continue
-
-        print(f"    📎 Total docs: {len(doc_links)}")
+        doc_links = extract_documents(driver, EGPS_DOC_SELECTOR, name_from_row=True, prefix=page_type)
         return doc_links, published_date
 
     except Exception as e:
@@ -316,28 +513,192 @@ def extract_egps_documents_and_published_date(driver, page_type="View"):
         return [], ""
 
 # ==============================
-# SCRAPE ECIL TENDERS
+# DETAIL PAGE WORKER POOL
 # ==============================
-def scrape_ecil():
-    print("\n" + "="*60)
-    print("SCRAPING ECIL TENDERS")
-    print("="*60)
-
+def build_chrome_options(cache_name=None):
     options = webdriver.ChromeOptions()
     options.add_argument('--disable-blink-features=AutomationControlled')
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')
     options.add_argument('--disable-gpu')
+    options.add_argument('--headless=new')
+    options.add_argument('--window-size=1400,900')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    # Return from driver.get() at DOMContentLoaded and skip images/notifications;
+    # the scraper only reads text and links
+    options.page_load_strategy = 'eager'
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2
+    })
+    # Persistent per-driver HTTP disk cache: repeat runs revalidate the portals'
+    # scripts/styles instead of downloading them again (Chrome's cache can't be
+    # shared between concurrent browsers, hence one directory per driver)
+    if cache_name:
+        options.add_argument(f"--disk-cache-dir={os.path.abspath(os.path.join(HTTP_CACHE_DIR, cache_name))}")
+    return options
+
+def run_detail_workers(fetch, jobs, cache_name, seed_url=None, cookies=None, default=None):
+    """
+    Run fetch(get_driver, job) for every job on a pool of Chrome workers.
+    Each worker thread creates one driver the first time get_driver() is called and
+    reuses it for all of its jobs; if cookies are given they are copied from the
+    listing session via seed_url first.
+    Returns results in the same order as jobs (default for jobs that failed).
+    """
+    local = threading.local()
+    drivers = []
+    drivers_lock = threading.Lock()
+
+    def get_worker_driver():
+        driver = getattr(local, "driver", None)
+        if driver is None:
+            with drivers_lock:
+                worker_index = len(drivers)
+                drivers.append(None)
+            driver = webdriver.Chrome(options=build_chrome_options(f"{cache_name}-detail-{worker_index}"))
+            drivers[worker_index] = driver
+            local.driver = driver
+            if seed_url and cookies:
+                driver.get(seed_url)
+                for cookie in cookies:
+                    try:
+                        driver.add_cookie(cookie)
+                    except Exception:
+                        pass
+        return driver
+
+    def run(job):
+        try:
+            return fetch(get_worker_driver, job)
+        except Exception as e:
+            print(f"  ✗ Detail worker error: {e}")
+            return default
+
+    try:
+        with ThreadPoolExecutor(max_workers=DETAIL_WORKERS, thread_name_prefix="detail") as executor:
+            return list(executor.map(run, jobs))
+    finally:
+        for driver in drivers:
+            if driver is None:
+                continue
+            try:
+                driver.quit()
+            except:
+                pass
+
+def fetch_page_documents(get_driver, url, extract, closing_date=""):
+    """
+    Load url and run extract(driver) -> (doc_links, published_date), memoized per URL
+    in doc_cache so a page is only loaded once per run (and once per cache week).
+    A cached page is re-read when the tender's closing date has changed since.
+    """
+    global doc_cache_unsaved
+    with doc_cache_lock:
+        cached = doc_cache.get(url)
+    if cached and cached.get("closing_date") == closing_date:
+        return [tuple(doc) for doc in cached["doc_links"]], cached["published_date"]
+
+    driver = get_driver()
+    driver.get(url)
+    doc_links, published_date = extract(driver)
+
+    # Empty results are not cached: they are usually a timeout, not a page without documents
+    if doc_links:
+        with doc_cache_lock:
+            doc_cache[url] = {
+                "doc_links": doc_links,
+                "published_date": published_date,
+                "closing_date": closing_date,
+                "week": current_cache_week()
+            }
+            # Checkpoint while scraping so a crashed run doesn't lose the pages already read
+            doc_cache_unsaved += 1
+            if doc_cache_unsaved >= DOC_CACHE_CHECKPOINT:
+                save_doc_cache(indent=None)
+    return doc_links, published_date
+
+def fetch_ecil_documents(get_driver, job):
+    tender_no, tender_link, closing_date = job
+    doc_links, _ = fetch_page_documents(
+        get_driver, tender_link, lambda driver: (extract_ecil_documents(driver), ""), closing_date
+    )
+    print(f"  ✅ {tender_no}: {len(doc_links)} docs")
+    return doc_links
+
+def fetch_egps_details(get_driver, job):
+    """
+    Returns (doc_links, published_date, fetched). fetched is only True when every
+    page returned documents; an empty page is usually a timeout, and the history
+    must not record it as the tender's complete document list.
+    """
+    tender_no, view_link, corrigendum_link, closing_date = job
+    doc_links = []
+    published_date = ""
+    fetched = True
+
+    # ── View page: docs AND published date ──
+    if view_link:
+        try:
+            doc_links, published_date = fetch_page_documents(
+                get_driver, view_link, lambda driver: extract_egps_documents_and_published_date(driver, "View"),
+                closing_date
+            )
+            fetched = bool(doc_links)
+        except Exception as e:
+            fetched = False
+            print(f"  ✗ View error ({tender_no}): {e}")
+
+    if corrigendum_link:
+        try:
+            corr_docs, _ = fetch_page_documents(
+                get_driver, corrigendum_link, lambda driver: extract_egps_documents_and_published_date(driver, "Corrigendum"),
+                closing_date
+            )
+            doc_links = doc_links + corr_docs
+            fetched = fetched and bool(corr_docs)
+        except Exception as e:
+            fetched = False
+            print(f"  ✗ Corrigendum error ({tender_no}): {e}")
+
+    print(f"  ✅ {tender_no}: {len(doc_links)} docs | Published: {published_date}")
+    return doc_links, published_date, fetched
+
+# ==============================
+# SCRAPE ECIL TENDERS
+# ==============================
+ECIL_HEADER_TEXTS = frozenset(("no.", "number", "tender no."))
+ECIL_HEADER_KEYWORDS = ("NIT", "Section", "Tender")
+
+def is_ecil_tender_row(cols):
+    """
+    ECIL table columns (from screenshot):
+    0=Section Unit, 1=Tender No, 2=Published Date, 3=Description, 4=Type, 5=Due Date/Time, 6=Due Days
+    Header, pagination and other noise rows have no real tender number (short,
+    a page number, or a column title) or no description.
+    """
+    if len(cols) < 6:
+        return False
+    tender_no = cols[1]
+    return (
+        len(tender_no) >= 5 and
+        not any(keyword in tender_no for keyword in ECIL_HEADER_KEYWORDS) and
+        tender_no.lower() not in ECIL_HEADER_TEXTS and
+        len(cols[3]) >= 5
+    )
+
+def scrape_ecil(known_tenders=None):
+    print("\n" + "="*60)
+    print("SCRAPING ECIL TENDERS")
+    print("="*60)
 
     driver = None
     try:
-        driver = webdriver.Chrome(options=options)
+        driver = webdriver.Chrome(options=build_chrome_options("ecil-listing"))
         wait = WebDriverWait(driver, 15)
 
         print("Loading ECIL website...")
-        driver.get("https://etenders.ecil.co.in/")
-        safe_maximize_window(driver)
-        time.sleep(3)
+        driver.get(ECIL_HOME_URL)
 
         try:
             nit_button = wait.until(
@@ -351,37 +712,28 @@ def scrape_ecil():
                 driver.quit()
             return []
 
-        time.sleep(3)
+        try:
+            wait_for(driver, ECIL_ROWS_LOCATOR, 15)
+        except TimeoutException:
+            print("⚠️ Tender table not loaded after clicking NIT")
 
         data = []
+        known_tenders = known_tenders or {}
 
         # Detect total pages
         total_pages = 1
         try:
-            pagination_links = driver.find_elements(By.XPATH,
-                "//a[@href and text()[string-length(normalize-space(.)) > 0]]"
-            )
-            page_numbers = []
-            for link in pagination_links:
-                text = link.text.strip()
-                if text.isdigit() and 1 <= len(text) <= 2:
-                    try:
-                        page_num = int(text)
-                        if 1 <= page_num <= 100:
-                            page_numbers.append(page_num)
-                    except ValueError:
-                        continue
+            page_numbers = [
+                int(text) for text in driver.execute_script(PAGE_LINK_TEXTS_JS, "a[href]")
+                if len(text) <= 2 and 1 <= int(text) <= 100
+            ]
             if page_numbers:
                 total_pages = max(page_numbers)
                 print(f"✓ Pagination detected: {sorted(set(page_numbers))}")
 
             if total_pages == 1:
-                page_text_elements = driver.find_elements(By.XPATH,
-                    "//*[contains(text(), 'of') or contains(@class, 'page')]"
-                )
-                for elem in page_text_elements:
-                    text = elem.text.strip()
-                    match = re.search(r'of\s+(\d+)', text, re.IGNORECASE)
+                for text in driver.execute_script(PAGE_OF_TEXTS_JS):
+                    match = PAGE_OF_RE.search(text)
                     if match:
                         total_pages = int(match.group(1))
                         print(f"✓ Found page count in text: {text}")
@@ -394,102 +746,40 @@ def scrape_ecil():
 
         for page in range(1, total_pages + 1):
             print(f"\nPAGE {page}/{total_pages}")
-            time.sleep(2)
 
-            rows = driver.find_elements(By.XPATH,
-                "//table//tbody//tr[td] | "
-                "//table[contains(@class, 'table')]//tr[td]"
-            )
+            rows = driver.execute_script(ECIL_LISTING_JS, ECIL_ROWS_LOCATOR[1])
             print(f"  Found {len(rows)} rows to process")
 
-            row_index = 0
             rows_processed_this_page = 0
 
-            while row_index < len(rows):
-                try:
-                    row = rows[row_index]
-                    cols = row.find_elements(By.TAG_NAME, "td")
-                except StaleElementReferenceException:
-                    print("  ⚠️ Stale element, refreshing rows...")
-                    rows = driver.find_elements(By.XPATH,
-                        "//table//tbody//tr[td] | "
-                        "//table[contains(@class, 'table')]//tr[td]"
-                    )
+            for row in rows:
+                cols = row["cells"]
+                if not is_ecil_tender_row(cols):
                     continue
 
-                # ECIL table columns (from screenshot):
-                # 0=Section Unit, 1=Tender No, 2=Published Date, 3=Description, 4=Type, 5=Due Date/Time, 6=Due Days
-                if len(cols) >= 6:
-                    tender_no = cols[1].text.strip()
-
-                    if (
-                        not tender_no or
-                        tender_no == "" or
-                        "NIT" in tender_no or
-                        "Section" in tender_no or
-                        "Tender" in tender_no or
-                        tender_no.lower() in ["no.", "number", "tender no."] or
-                        (tender_no.isdigit() and len(tender_no) <= 2)
-                    ):
-                        row_index += 1
-                        continue
-
-                    if len(tender_no) < 5:
-                        row_index += 1
-                        continue
-
-                    # ── Extract Published Date from col[2] ──
-                    published_date = cols[2].text.strip() if len(cols) > 2 else ""
-
-                    description = cols[3].text.strip() if len(cols) > 3 else ""
-                    due_date = cols[5].text.strip() if len(cols) > 5 else ""
-
-                    if not description or len(description) < 5:
-                        row_index += 1
-                        continue
+                tender_no = cols[1]
+                # ── Extract Published Date from col[2] ──
+                published_date = cols[2]
+                description = cols[3]
+                due_date = cols[5]
+                tender_link = row["link"]
 
-                    try:
-                        tender_link = cols[1].find_element(By.TAG_NAME, "a").get_attribute("href")
-                    except:
-                        tender_link = ""
-
-                    print(f"📋 {tender_no} | Published: {published_date}")
-                    rows_processed_this_page += 1
-
-                    doc_links = []
-                    if tender_link:
-                        print(f"  🔍 Extracting documents...")
-                        main_window = driver.current_window_handle
-                        try:
-                            driver.execute_script(f"window.open('{tender_link}');")
-                            time.sleep(2)
-                            if len(driver.window_handles) > 1:
-                                driver.switch_to.window(driver.window_handles[-1])
-                                doc_links = extract_ecil_documents(driver)
-                                driver.close()
-                                driver.switch_to.window(main_window)
-                            else:
-                                print("  ⚠️ New window didn't open")
-                        except Exception as e:
-                            print(f"  ✗ Document extraction error: {e}")
-                            safe_close_extra_windows(driver, main_window)
-
-                    print(f"  ✅ {len(doc_links)} docs")
-
-                    # Entry structure:
-                    # [tender_no, centre, description, closing_date, published_date, opening_date, link, doc_links]
-                    data.append([
-                        tender_no,          # 0 tender_no
-                        "-----",            # 1 centre (ECIL doesn't have centre)
-                        description,        # 2 description
-                        due_date,           # 3 closing/due date
-                        published_date,     # 4 published date  ← NEW
-                        "-----",            # 5 opening date (ECIL doesn't show separately)
-                        tender_link,        # 6 link
-                        doc_links           # 7 docs
-                    ])
-
-                row_index += 1
+                print(f"📋 {tender_no} | Published: {published_date}")
+                rows_processed_this_page += 1
+
+                # Entry structure:
+                # [tender_no, centre, description, closing_date, published_date, opening_date, link, doc_links, details]
+                data.append([
+                    tender_no,          # 0 tender_no
+                    "-----",            # 1 centre (ECIL doesn't have centre)
+                    description,        # 2 description
+                    due_date,           # 3 closing/due date
+                    published_date,     # 4 published date  ← NEW
+                    "-----",            # 5 opening date (ECIL doesn't show separately)
+                    tender_link,        # 6 link
+                    [],                 # 7 docs (filled in by the detail workers)
+                    {"details_fetched": False}  # 8 history markers
+                ])
 
             print(f"  ✓ Processed {rows_processed_this_page} tenders on this page")
 
@@ -499,15 +789,45 @@ def scrape_ecil():
                         f"//a[@href and normalize-space(text())='{page+1}']"
                     )
                     print(f"  🔄 Navigating to page {page+1}...")
+                    old_first_row = next(iter(driver.find_elements(*ECIL_ROWS_LOCATOR)), None)
                     driver.execute_script("arguments[0].scrollIntoView(true);", next_page_link)
-                    time.sleep(0.5)
                     driver.execute_script("arguments[0].click();", next_page_link)
-                    time.sleep(3)
-                    time.sleep(2)
+                    wait_for_page_change(driver, old_first_row, ECIL_ROWS_LOCATOR)
                 except Exception as e:
                     print(f"  ⚠️ Could not navigate to page {page+1}: {e}")
                     break
 
+        # ── Fetch detail pages in parallel ──
+        detail_jobs = []
+        reused = 0
+        for i, entry in enumerate(data):
+            if not entry[6]:
+                continue
+            cached = get_cached_details(known_tenders, entry[0], entry[3])
+            if cached:
+                entry[7] = [tuple(doc) for doc in cached["doc_links"]]
+                entry[8]["details_fetched"] = True
+                reused += 1
+            else:
+                detail_jobs.append((i, (entry[0], entry[6], entry[3])))
+
+        if reused:
+            print(f"\n♻️ Reusing cached documents for {reused} unchanged tenders")
+        if detail_jobs:
+            print(f"\n🔍 Extracting documents for {len(detail_jobs)} tenders ({DETAIL_WORKERS} workers)...")
+            results = run_detail_workers(
+                fetch_ecil_documents,
+                [job for _, job in detail_jobs],
+                "ecil",
+                seed_url=ECIL_HOME_URL,
+                cookies=driver.get_cookies(),
+                default=[]
+            )
+            for (i, _), doc_links in zip(detail_jobs, results):
+                data[i][7] = doc_links
+                # Empty results are not trusted as complete (see fetch_page_documents)
+                data[i][8]["details_fetched"] = bool(doc_links)
+
         print(f"\n✅ ECIL: {len(data)} tenders scraped")
         return data
 
@@ -527,68 +847,62 @@ def scrape_ecil():
 # ==============================
 # SCRAPE EGPS (ISRO) TENDERS
 # ==============================
-def scrape_egps():
+def scrape_egps(known_tenders=None):
     print("\n" + "="*60)
     print("SCRAPING EGPS (ISRO) TENDERS")
     print("="*60)
 
-    options = webdriver.ChromeOptions()
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-gpu')
-
     driver = None
     try:
-        driver = webdriver.Chrome(options=options)
+        driver = webdriver.Chrome(options=build_chrome_options("egps-listing"))
         wait = WebDriverWait(driver, 15)
 
         print("Loading EGPS website...")
-        driver.get("https://eproc.isro.gov.in/home.html")
-        safe_maximize_window(driver)
+        driver.get(EGPS_HOME_URL)
         wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table")))
-        time.sleep(2)
+        try:
+            wait_for(driver, EGPS_ROWS_LOCATOR)
+        except TimeoutException:
+            print("⚠️ Tender rows not loaded")
 
         data = []
+        detail_jobs = []
+        known_tenders = known_tenders or {}
 
-        page_elements = driver.find_elements(By.XPATH, "//a[text()[number(.)=number(.)]]")
-        pages = [int(el.text.strip()) for el in page_elements if el.text.strip().isdigit()]
+        pages = [int(text) for text in driver.execute_script(PAGE_LINK_TEXTS_JS, "a")]
         total_pages = max(pages) if pages else 1
 
         print(f"Total pages: {total_pages}\n")
 
         for page in range(1, total_pages + 1):
             print(f"\nPAGE {page}/{total_pages}")
-            time.sleep(2)
 
-            rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
+            rows = driver.execute_script(EGPS_LISTING_JS)
 
             for row in rows:
-                cols = row.find_elements(By.TAG_NAME, "td")
+                cols = row["cells"]
                 if len(cols) < 6:
                     continue
 
-                tender_no = cols[0].text.strip()
-                centre = cols[1].text.strip()
-                description = cols[2].text.strip()
-                closing = cols[3].text.strip()
-                opening = cols[4].text.strip()
+                tender_no = cols[0]
+                centre = cols[1]
+                description = cols[2]
+                closing = cols[3]
+                opening = cols[4]
 
                 print(f"📋 {tender_no}")
 
                 doc_links = []
                 published_date = ""
 
-                action_links = cols[5].find_elements(By.TAG_NAME, "a")
-
                 tender_pdf = None
                 view_link = None
                 corrigendum_link = None
 
-                for l in action_links:
-                    text = l.text.strip()
-                    href = l.get_attribute("href") or ""
-                    data_url = l.get_attribute("data-url") or ""
+                for l in row["actions"]:
+                    text = l["text"]
+                    href = l["href"]
+                    data_url = l["data_url"]
 
                     if "Tender Document" in text and href:
                         tender_pdf = href
@@ -604,78 +918,63 @@ def scrape_egps():
                     doc_links.append(("Tender Document", tender_pdf))
                     print(f"  📄 Main PDF")
 
-                main_window = driver.current_window_handle
-
-                # ── Open View page: extract docs AND published date ──
-                if view_link:
-                    print(f"  🔍 View page (docs + published date)...")
-                    try:
-                        driver.execute_script("window.open(arguments[0]);", view_link)
-                        time.sleep(2)
-
-                        if len(driver.window_handles) > 1:
-                            driver.switch_to.window(driver.window_handles[-1])
-                            view_docs, pub_date = extract_egps_documents_and_published_date(driver, "View")
-
-                            if pub_date:
-                                published_date = pub_date
-
-                            for name, url in view_docs:
-                                if url not in [x[1] for x in doc_links]:
-                                    doc_links.append((name, url))
-
-                            driver.close()
-                            driver.switch_to.window(main_window)
-
-                    except Exception as e:
-                        print(f"  ✗ View error: {e}")
-                        safe_close_extra_windows(driver, main_window)
-
-                if corrigendum_link:
-                    print(f"  📝 Corrigendum docs...")
-                    try:
-                        driver.execute_script("window.open(arguments[0]);", corrigendum_link)
-                        time.sleep(2)
-
-                        if len(driver.window_handles) > 1:
-                            driver.switch_to.window(driver.window_handles[-1])
-                            corr_docs, _ = extract_egps_documents_and_published_date(driver, "Corrigendum")
-
-                            for name, url in corr_docs:
-                                if url not in [x[1] for x in doc_links]:
-                                    doc_links.append((name, url))
-
-                            driver.close()
-                            driver.switch_to.window(main_window)
-
-                    except Exception as e:
-                        print(f"  ✗ Corrigendum error: {e}")
-                        safe_close_extra_windows(driver, main_window)
-
-                print(f"  ✅ {len(doc_links)} docs | Published: {published_date}")
+                details = {"details_fetched": False, "corrigendum_link": corrigendum_link or ""}
+                cached = get_cached_details(known_tenders, tender_no, closing, details["corrigendum_link"])
+                if cached:
+                    doc_links = [tuple(doc) for doc in cached["doc_links"]]
+                    published_date = cached.get("published_date", "")
+                    details["details_fetched"] = True
+                    print(f"  ♻️ Unchanged, reusing {len(doc_links)} cached docs")
+                elif view_link or corrigendum_link:
+                    detail_jobs.append((len(data), (tender_no, view_link, corrigendum_link, closing)))
 
                 # Entry structure:
-                # [tender_no, centre, description, closing_date, published_date, opening_date, link, doc_links]
+                # [tender_no, centre, description, closing_date, published_date, opening_date, link, doc_links, details]
                 data.append([
                     tender_no,          # 0 tender_no
                     centre,             # 1 centre
                     description,        # 2 description
                     closing,            # 3 closing date
-                    published_date,     # 4 published date  ← NEW
+                    published_date,     # 4 published date (filled in by the detail workers)
                     opening,            # 5 opening date
                     view_link or "",    # 6 link
-                    doc_links           # 7 docs
+                    doc_links,          # 7 docs
+                    details             # 8 history markers
                 ])
 
             if page < total_pages:
                 try:
                     next_page = driver.find_element(By.XPATH, f"//a[text()='{page+1}']")
+                    old_first_row = next(iter(driver.find_elements(By.CSS_SELECTOR, "table tbody tr")), None)
                     driver.execute_script("arguments[0].click();", next_page)
-                    time.sleep(2)
+                    wait_for_page_change(driver, old_first_row, EGPS_ROWS_LOCATOR)
                 except Exception as e:
                     print(f"  ⚠️ Could not navigate to page {page+1}: {e}")
                     break
 
+        # ── Fetch View/Corrigendum pages in parallel: docs AND published date ──
+        if detail_jobs:
+            print(f"\n🔍 Extracting documents for {len(detail_jobs)} tenders ({DETAIL_WORKERS} workers)...")
+            results = run_detail_workers(
+                fetch_egps_details,
+                [job for _, job in detail_jobs],
+                "egps",
+                seed_url=EGPS_HOME_URL,
+                cookies=driver.get_cookies(),
+                default=([], "", False)
+            )
+            for (i, _), (detail_docs, published_date, fetched) in zip(detail_jobs, results):
+                entry = data[i]
+                doc_links = entry[7]
+                seen_urls = {url for _, url in doc_links}
+                for name, url in detail_docs:
+                    if url not in seen_urls:
+                        seen_urls.add(url)
+                        doc_links.append((name, url))
+                if published_date:
+                    entry[4] = published_date
+                entry[8]["details_fetched"] = fetched
+
         print(f"\n✅ EGPS: {len(data)} tenders scraped")
         return data
 
@@ -697,8 +996,17 @@ def scrape_egps():
 # ==============================
 
 try:
-    ecil_data = scrape_ecil()
-    egps_data = scrape_egps()
+    history = load_tender_history()
+    doc_cache.update(load_doc_cache())
+
+    # Each scraper owns its own Chrome instance, so both sites can run side by side
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="scraper") as executor:
+        ecil_future = executor.submit(scrape_ecil, history["ECIL"])
+        egps_future = executor.submit(scrape_egps, history["EGPS"])
+        ecil_data = ecil_future.result()
+        egps_data = egps_future.result()
+
+    save_doc_cache()
 
     print(f"\n{'='*60}")
     print("COMBINING DATA")
@@ -712,8 +1020,6 @@ try:
     print(f"Max docs EGPS: {max_docs_egps}")
     print(f"Max docs overall: {max_docs}")
 
-    history = load_tender_history()
-
     ecil_changes = check_date_changes(ecil_data, history, "ECIL")
     egps_changes = check_date_changes(egps_data, history, "EGPS")
 
@@ -731,83 +1037,57 @@ try:
         for change in egps_changes:
             print(f"    {change['tender_no']}: {change['old_date']} → {change['new_date']}")
 
-    changed_tenders = set()
-    for change in ecil_changes + egps_changes:
-        changed_tenders.add((change['source'], change['tender_no']))
-
-    ecil_new = []
-    ecil_changed = []
-    ecil_existing = []
-    egps_new = []
-    egps_changed = []
-    egps_existing = []
-
-    for entry in ecil_data:
-        tender_no = entry[0]
-        if tender_no not in history["ECIL"]:
-            ecil_new.append(["NEW", "ECIL"] + entry)
-        elif ("ECIL", tender_no) in changed_tenders:
-            ecil_changed.append(["DATE CHANGED", "ECIL"] + entry)
-        else:
-            ecil_existing.append(["EXISTING", "ECIL"] + entry)
-
-    for entry in egps_data:
-        tender_no = entry[0]
-        if tender_no not in history["EGPS"]:
-            egps_new.append(["NEW", "EGPS"] + entry)
-        elif ("EGPS", tender_no) in changed_tenders:
-            egps_changed.append(["DATE CHANGED", "EGPS"] + entry)
-        else:
-            egps_existing.append(["EXISTING", "EGPS"] + entry)
+    # One pass per source: status is decided and the Excel row built in the
+    # same loop, bucketed so the sheet keeps NEW, DATE CHANGED, EXISTING order
+    status_rows = {"NEW": [], "DATE CHANGED": [], "EXISTING": []}
+    status_counts = {"ECIL": Counter(), "EGPS": Counter()}
+    empty_tail = [""] * (2 * max_docs)
+
+    for source, data, changes in (("ECIL", ecil_data, ecil_changes), ("EGPS", egps_data, egps_changes)):
+        known_tenders = history[source]
+        changed_tenders = {change['tender_no'] for change in changes}
+
+        for tender_no, centre, description, closing_date, published_date, opening_date, link, docs, _ in data:
+            if tender_no not in known_tenders:
+                status = "NEW"
+            elif tender_no in changed_tenders:
+                status = "DATE CHANGED"
+            else:
+                status = "EXISTING"
+            status_counts[source][status] += 1
+
+            # ── Column order as requested ──
+            # Status | Source | Tender Number | Published Date | Bid Opening Date | Bid Closing Date |
+            # Centre/Organization | Description | Tender Link | Doc1 Name | Doc1 Link | ...
+            row = [
+                status,
+                source,
+                tender_no,
+                published_date,
+                opening_date,
+                closing_date,
+                centre,
+                description,
+                link
+            ]
+
+            row.extend(chain.from_iterable(docs))
+            pad = 2 * (max_docs - len(docs))
+            if pad:
+                row.extend(empty_tail[:pad])
+
+            status_rows[status].append(row)
+
+    ecil_new, ecil_changed, ecil_existing = (status_counts["ECIL"][s] for s in status_rows)
+    egps_new, egps_changed, egps_existing = (status_counts["EGPS"][s] for s in status_rows)
 
     print(f"\n📊 Categorization:")
-    print(f"  ECIL - New: {len(ecil_new)}, Date Changed: {len(ecil_changed)}, Existing: {len(ecil_existing)}")
-    print(f"  EGPS - New: {len(egps_new)}, Date Changed: {len(egps_changed)}, Existing: {len(egps_existing)}")
-
-    all_tenders = (ecil_new + egps_new +
-                   ecil_changed + egps_changed +
-                   ecil_existing + egps_existing)
+    print(f"  ECIL - New: {ecil_new}, Date Changed: {ecil_changed}, Existing: {ecil_existing}")
+    print(f"  EGPS - New: {egps_new}, Date Changed: {egps_changed}, Existing: {egps_existing}")
 
     print("\nBuilding Excel...")
 
-    rows = []
-    for entry in all_tenders:
-        # entry = [status, source, tender_no, centre, description, closing_date, published_date, opening_date, link, docs]
-        status       = entry[0]
-        source       = entry[1]
-        tender_no    = entry[2]
-        centre       = entry[3]
-        description  = entry[4]
-        closing_date = entry[5]
-        published_date = entry[6]
-        opening_date = entry[7]
-        link         = entry[8]
-        docs         = entry[9]
-
-        # ── Column order as requested ──
-        # Status | Source | Tender Number | Published Date | Bid Opening Date | Bid Closing Date |
-        # Centre/Organization | Description | Tender Link | Doc1 Name | Doc1 Link | ...
-        row = [
-            status,
-            source,
-            tender_no,
-            published_date,
-            opening_date,
-            closing_date,
-            centre,
-            description,
-            link
-        ]
-
-        for i in range(max_docs):
-            if i < len(docs):
-                row.append(docs[i][0])
-                row.append(docs[i][1])
-            else:
-                row.append("")
-                row.append("")
-
-        rows.append(row)
+    rows = status_rows["NEW"] + status_rows["DATE CHANGED"] + status_rows["EXISTING"]
 
     columns = [
         "Status",
@@ -825,121 +1105,89 @@ try:
         columns.append(f"Document {i} Name")
         columns.append(f"Document {i} Link")
 
-    combined_df = pd.DataFrame(rows, columns=columns)
-
     file_name, is_timestamped = get_available_filename(base_file_name)
 
-    with pd.ExcelWriter(file_name, engine="openpyxl") as writer:
-        combined_df.to_excel(writer, sheet_name="All Tenders", index=False)
-
-        ecil_df = combined_df[combined_df["Source"] == "ECIL"]
-        if not ecil_df.empty:
-            ecil_df.to_excel(writer, sheet_name="ECIL", index=False)
-
-        egps_df = combined_df[combined_df["Source"] == "EGPS"]
-        if not egps_df.empty:
-            egps_df.to_excel(writer, sheet_name="EGPS", index=False)
-
-        if not egps_df.empty:
-            centres = sorted(egps_df["Centre/Organization"].unique())
-            for centre in centres:
-                if centre and centre != "-----":
-                    centre_df = egps_df[egps_df["Centre/Organization"] == centre]
-                    sheet_name = centre[:31].replace('/', '-').replace('\\', '-').replace('*', '').replace('[', '').replace(']', '')
-                    try:
-                        centre_df.to_excel(writer, sheet_name=sheet_name, index=False)
-                    except Exception as e:
-                        print(f"⚠️ Could not create sheet for {centre}: {e}")
-
-    print("Formatting Excel...")
-
-    wb = load_workbook(file_name)
-
-    green_fill  = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-    yellow_fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-    gray_fill   = PatternFill(start_color="D9D9D9", end_color="D9D9D9", fill_type="solid")
-    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-
-    for sheet in wb.sheetnames:
-        ws = wb[sheet]
-        headers = {}
-
-        for col in range(1, ws.max_column + 1):
-            cell_value = ws.cell(row=1, column=col).value
-            headers[cell_value] = col
-            ws.cell(row=1, column=col).fill = header_fill
-            ws.cell(row=1, column=col).font = Font(bold=True, color="FFFFFF")
+    # Sheets are written straight from the row lists; no DataFrame copies
+    sheets = [("All Tenders", rows)]
+
+    ecil_rows = [row for row in rows if row[1] == "ECIL"]
+    if ecil_rows:
+        sheets.append(("ECIL", ecil_rows))
+
+    egps_rows = [row for row in rows if row[1] == "EGPS"]
+    if egps_rows:
+        sheets.append(("EGPS", egps_rows))
+
+    # Group EGPS rows by centre in one pass rather than one scan per centre
+    centre_groups = defaultdict(list)
+    for row in egps_rows:
+        centre_groups[row[6]].append(row)
+
+    for centre in sorted(centre_groups):
+        if centre and centre != "-----":
+            sheets.append((sanitize_sheet_name(centre), centre_groups[centre]))
+
+    # Write-only workbook: rows are streamed to disk already styled, so there is
+    # no second load_workbook + formatting pass over every cell
+    wb = Workbook(write_only=True)
+    for style in EXCEL_STYLES:
+        wb.add_named_style(style)
+
+    status_col = columns.index("Status")
+    tender_num_col = columns.index("Tender Number")
+    tender_link_col = columns.index("Tender Link")
+    doc_cols = [
+        (columns.index(f"Document {i} Name"), columns.index(f"Document {i} Link"))
+        for i in range(1, max_docs + 1)
+    ]
+    hidden_cols = {link_col for _, link_col in doc_cols}
 
-        for row in range(2, ws.max_row + 1):
-            status_cell = ws.cell(row=row, column=headers.get("Status", 1))
+    for sheet_name, sheet_rows in sheets:
+        try:
+            ws = wb.create_sheet(sheet_name)
+        except Exception as e:
+            print(f"⚠️ Could not create sheet for {sheet_name}: {e}")
+            continue
 
-            if status_cell.value == "NEW":
-                row_fill = green_fill
-            elif status_cell.value == "DATE CHANGED":
-                row_fill = yellow_fill
-            else:
-                row_fill = gray_fill
-
-            for col in range(1, ws.max_column + 1):
-                ws.cell(row=row, column=col).fill = row_fill
-
-            for i in range(1, max_docs + 1):
-                name_col = headers.get(f"Document {i} Name")
-                link_col = headers.get(f"Document {i} Link")
-
-                if name_col and link_col:
-                    name = ws.cell(row=row, column=name_col).value
-                    url  = ws.cell(row=row, column=link_col).value
-
-                    if name and url:
-                        cell = ws.cell(row=row, column=name_col)
-                        cell.hyperlink = url
-                        cell.font = Font(color="0563C1", underline="single")
-
-        # Hide raw link columns
-        for i in range(1, max_docs + 1):
-            link_col = headers.get(f"Document {i} Link")
-            if link_col:
-                col_letter = ws.cell(row=1, column=link_col).column_letter
-                ws.column_dimensions[col_letter].hidden = True
-
-        # Also hide Tender Link column (hyperlink is embedded in Tender Number cell or keep visible)
-        # Auto-fit visible columns
-        for col in range(1, min(ws.max_column + 1, 20)):
-            column_letter = ws.cell(row=1, column=col).column_letter
-            if not ws.column_dimensions[column_letter].hidden:
-                max_length = 0
-                for row_num in range(1, min(ws.max_row + 1, 100)):
-                    try:
-                        cell_value = str(ws.cell(row=row_num, column=col).value or "")
-                        if len(cell_value) > max_length:
-                            max_length = len(cell_value)
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
-
-    # Apply hyperlinks to Tender Number column as well
-    for sheet in wb.sheetnames:
-        ws = wb[sheet]
-        headers = {}
-        for col in range(1, ws.max_column + 1):
-            cell_value = ws.cell(row=1, column=col).value
-            headers[cell_value] = col
-
-        tender_num_col = headers.get("Tender Number")
-        tender_link_col = headers.get("Tender Link")
-
-        if tender_num_col and tender_link_col:
-            for row in range(2, ws.max_row + 1):
-                tender_num_cell = ws.cell(row=row, column=tender_num_col)
-                tender_link_val = ws.cell(row=row, column=tender_link_col).value
-                if tender_num_cell.value and tender_link_val:
-                    tender_num_cell.hyperlink = tender_link_val
-                    current_font = tender_num_cell.font
-                    tender_num_cell.font = Font(
-                        color="0563C1", underline="single", bold=current_font.bold
-                    )
+        # Column dimensions are written with the first row in write-only mode,
+        # so size them up front: auto-fit visible columns, hide raw link columns
+        for col in range(min(len(columns), 19)):
+            if col in hidden_cols:
+                continue
+            max_length = len(columns[col])
+            for row in sheet_rows[:98]:
+                if len(str(row[col])) > max_length:
+                    max_length = len(str(row[col]))
+            ws.column_dimensions[get_column_letter(col + 1)].width = min(max_length + 2, 50)
+        for col in hidden_cols:
+            ws.column_dimensions[get_column_letter(col + 1)].hidden = True
+
+        header_cells = []
+        for value in columns:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = HEADER_STYLE.name
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        for row in sheet_rows:
+            row_style = STATUS_STYLES.get(row[status_col], ROW_EXISTING_STYLE.name)
+
+            cells = []
+            for value in row:
+                cell = WriteOnlyCell(ws, value=value if value != "" else None)
+                cell.style = row_style
+                cells.append(cell)
+
+            # Hyperlink document names and the Tender Number
+            for name_col, link_col in doc_cols:
+                if row[name_col] and row[link_col]:
+                    cells[name_col].hyperlink = row[link_col]
+                    cells[name_col].font = LINK_FONT
+            if row[tender_num_col] and row[tender_link_col]:
+                cells[tender_num_col].hyperlink = row[tender_link_col]
+                cells[tender_num_col].font = LINK_FONT
+
+            ws.append(cells)
 
     wb.save(file_name)
 
@@ -949,19 +1197,23 @@ try:
     if is_timestamped:
         print(f"\n⚠️ NOTE: Original file was locked, created: {file_name}")
 
-    update_tender_history(ecil_data, egps_data)
+    update_tender_history(history, ecil_data, egps_data)
 
     # ── Email ──
     if sender_email and app_password and receiver_emails:
         print("\nSending email...")
 
+        # Only needed when an email is actually sent
+        import smtplib
+        from email.message import EmailMessage
+
         msg = EmailMessage()
         msg["From"] = sender_email
         msg["To"] = ", ".join(receiver_emails)
 
         subject_parts = []
-        if len(ecil_new) + len(egps_new) > 0:
-            subject_parts.append(f"{len(ecil_new) + len(egps_new)} NEW")
+        if ecil_new + egps_new > 0:
+            subject_parts.append(f"{ecil_new + egps_new} NEW")
         if len(ecil_changes) + len(egps_changes) > 0:
             subject_parts.append(f"{len(ecil_changes) + len(egps_changes)} DATE CHANGED")
 
@@ -992,22 +1244,22 @@ try:
 {datetime.now().strftime("%Y-%m-%d %I:%M %p")}
 
 📊 ECIL Summary:
-  🆕 NEW: {len(ecil_new)}
-  ⚠️ DATE CHANGED: {len(ecil_changed)}
-  📋 EXISTING: {len(ecil_existing)}
+  🆕 NEW: {ecil_new}
+  ⚠️ DATE CHANGED: {ecil_changed}
+  📋 EXISTING: {ecil_existing}
   📝 Total: {len(ecil_data)}
 
 📊 EGPS (ISRO) Summary:
-  🆕 NEW: {len(egps_new)}
-  ⚠️ DATE CHANGED: {len(egps_changed)}
-  📋 EXISTING: {len(egps_existing)}
+  🆕 NEW: {egps_new}
+  ⚠️ DATE CHANGED: {egps_changed}
+  📋 EXISTING: {egps_existing}
   📝 Total: {len(egps_data)}
 
 📊 Overall:
-  🆕 Total NEW: {len(ecil_new) + len(egps_new)}
-  ⚠️ Total DATE CHANGED: {len(ecil_changed) + len(egps_changed)}
-  📋 Total EXISTING: {len(ecil_existing) + len(egps_existing)}
-  📝 Grand Total: {len(all_tenders)}
+  🆕 Total NEW: {ecil_new + egps_new}
+  ⚠️ Total DATE CHANGED: {ecil_changed + egps_changed}
+  📋 Total EXISTING: {ecil_existing + egps_existing}
+  📝 Grand Total: {len(rows)}
   📄 Max Documents/Tender: {max_docs}
   📂 Total Sheets: {len(wb.sheetnames)}
 {change_details}
@@ -1034,9 +1286,9 @@ try:
         print("\n⚠️ Email not sent - credentials not configured")
 
     print(f"\n🎉 COMPLETED!")
-    print(f"   ECIL: {len(ecil_new)} new | {len(ecil_changed)} date changed | {len(ecil_existing)} existing")
-    print(f"   EGPS: {len(egps_new)} new | {len(egps_changed)} date changed | {len(egps_existing)} existing")
-    print(f"   TOTAL: {len(ecil_new)+len(egps_new)} new | {len(ecil_changed)+len(egps_changed)} date changed | {len(ecil_existing)+len(egps_existing)} existing")
+    print(f"   ECIL: {ecil_new} new | {ecil_changed} date changed | {ecil_existing} existing")
+    print(f"   EGPS: {egps_new} new | {egps_changed} date changed | {egps_existing} existing")
+    print(f"   TOTAL: {ecil_new+egps_new} new | {ecil_changed+egps_changed} date changed | {ecil_existing+egps_existing} existing")
 
 except Exception as e:
     print(f"\n❌ CRITICAL ERROR: {e}")